@@ -0,0 +1,318 @@
+"""Shared link-budget math and constant tables for the SATCOM link tool.
+
+Everything in this module is Streamlit-free so the UI script can stay a
+thin widget layer; the app wraps the pure functions in st.cache_data
+where memoization helps.
+"""
+
+import functools
+import numpy as np
+import re
+import types
+from dataclasses import dataclass
+from math import log10, pi
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional: the NumPy sweep path covers batch evaluation, just
+    # without the fused-loop speedup for very large Monte Carlo runs.
+    njit = None
+
+
+# ----------------------------------------
+# MODCOD Table
+# ----------------------------------------
+modcod_table = {
+    "BPSK 1/2": {"required_ebn0": 1.5, "spectral_efficiency": 0.5},
+    "QPSK 1/2": {"required_ebn0": 2.0, "spectral_efficiency": 1.0},
+    "QPSK 3/4": {"required_ebn0": 4.5, "spectral_efficiency": 1.5},
+    "8PSK 2/3": {"required_ebn0": 6.5, "spectral_efficiency": 2.0},
+    "16QAM 3/4": {"required_ebn0": 9.0, "spectral_efficiency": 3.0}
+}
+
+@dataclass(frozen=True, slots=True)
+class Modcod:
+    required_ebn0: float
+    spectral_efficiency: float
+
+
+# Frozen per-MODCOD records: attribute access is a C-level slot read, and
+# the entries cannot be mutated out from under the caches.
+MODCOD = {name: Modcod(**fields) for name, fields in modcod_table.items()}
+
+# Structure-of-arrays view of the table: one integer index fetches both
+# fields as plain floats, and the arrays can feed vectorized MODCOD sweeps.
+MODCOD_NAMES = tuple(modcod_table)
+MODCOD_IDX = {name: i for i, name in enumerate(MODCOD_NAMES)}
+MODCOD_REQ = np.array([modcod_table[n]["required_ebn0"] for n in MODCOD_NAMES])
+MODCOD_SE = np.array([modcod_table[n]["spectral_efficiency"] for n in MODCOD_NAMES])
+# 10*log10(se) per MODCOD, precomputed so an Eb/N0 sweep over MODCODs needs
+# no log10 at all.
+MODCOD_LOG_SE = 10.0 * np.log10(MODCOD_SE)
+
+
+def modcod_params(name):
+    """Return (required_ebn0, spectral_efficiency) for a MODCOD as floats."""
+    m = MODCOD[name]
+    return m.required_ebn0, m.spectral_efficiency
+
+# ----------------------------------------
+# Environment Loss Defaults
+# ----------------------------------------
+# Default (rain fade dB, misc losses dB) pairs per operating environment.
+# Frozen so reruns do a tuple unpack instead of rebuilding nested dicts.
+ENV_LOSSES = types.MappingProxyType({
+    "Clear sky / LOS": (0.0, 1.0),
+    "Light rain": (1.0, 2.0),
+    "Moderate rain": (3.0, 2.0),
+    "Heavy rain": (8.0, 3.0),
+    "Urban / obstructed": (3.0, 6.0),
+})
+
+# ----------------------------------------
+# Frequency Band Classifier
+# ----------------------------------------
+BAND_EDGES = np.array([3e8, 1e9, 2e9, 4e9, 8e9, 12e9, 18e9, 26e9])
+BAND_NAMES = ("HF/VHF", "UHF", "L-band", "S-band", "C-band", "X-band", "Ku-band", "K-band", "Ka-band")
+
+
+_BAND_NAMES_ARR = np.array(BAND_NAMES)
+
+
+@functools.lru_cache(maxsize=64)
+def classify_band(freq_hz):
+    # Slider/preset frequencies repeat constantly, so the lru_cache turns
+    # warm calls into a dict hit; cold calls do one binary search.
+    # side="right" keeps a frequency equal to an edge in the higher band.
+    return BAND_NAMES[int(np.searchsorted(BAND_EDGES, freq_hz, side="right"))]
+
+
+def classify_band_array(freq_hz):
+    """Vectorized classify_band for frequency sweeps.
+
+    One searchsorted pass plus a fancy index labels a whole frequency axis
+    with no Python-level branching; boundary handling matches the scalar
+    classifier.
+    """
+    return _BAND_NAMES_ARR[np.searchsorted(BAND_EDGES, freq_hz, side="right")]
+
+
+# ----------------------------------------
+# Link Margin and Eb/N0 Calculator
+# ----------------------------------------
+# FSPL = 20*log10(4*pi*d*f/c); the constant part is folded once here so the
+# per-call work is two log10 calls on the varying terms.
+K_FSPL_DB = 20.0 * log10(4.0 * pi * 1000.0 / 3e8)
+K_THERMAL_DBW = -228.6  # Boltzmann constant, dBW/Hz/K
+
+
+def calculate_link_metrics(
+    tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz,
+    distance_km, noise_figure_db, bandwidth_hz,
+    spectral_efficiency, required_ebn0,
+    rain_fade_db=0.0, misc_losses_db=0.0
+):
+    # Single fused log10(d*f) as in the sweep path: one transcendental call
+    # for the two varying FSPL terms.
+    fspl_db = 20.0 * log10(distance_km * freq_hz) + K_FSPL_DB
+    total_loss_db = fspl_db + rain_fade_db + misc_losses_db
+
+    # Folded EIRP + Rx gain - losses into one expression; left-to-right
+    # ordering matches the previous two-step form bit-for-bit.
+    c_rx_dbw = tx_power_dbw + tx_gain_dbi + rx_gain_dbi - total_loss_db
+
+    bw_db = 10.0 * log10(bandwidth_hz)
+    noise_floor_dbw = K_THERMAL_DBW + bw_db + noise_figure_db
+    cn0_dbhz = c_rx_dbw - noise_floor_dbw + bw_db
+
+    data_rate_bps = bandwidth_hz * spectral_efficiency
+    # Eb/N0 = C/N0 - 10*log10(bw*se); the bandwidth terms cancel, leaving
+    # only the spectral-efficiency log.
+    ebn0_db = c_rx_dbw - noise_floor_dbw - 10.0 * log10(spectral_efficiency)
+    link_margin_db = ebn0_db - required_ebn0
+
+    return (
+        link_margin_db,
+        ebn0_db,
+        fspl_db,
+        total_loss_db,
+        noise_floor_dbw,
+        c_rx_dbw,
+        data_rate_bps,
+        cn0_dbhz
+    )
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _link_batch_kernel(
+        tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz,
+        distance_km, noise_figure_db, bandwidth_hz,
+        spectral_efficiency, required_ebn0,
+        rain_fade_db, misc_losses_db,
+        out_margin, out_ebn0, out_fspl, out_total_loss,
+        out_noise_floor, out_c_rx, out_data_rate, out_cn0
+    ):
+        # Same math as calculate_link_metrics, fused into one compiled loop
+        # with no intermediate arrays; log10 lowers to an LLVM intrinsic.
+        for i in prange(freq_hz.size):
+            fspl_db = 20.0 * log10(distance_km[i] * freq_hz[i]) + K_FSPL_DB
+            total_loss_db = fspl_db + rain_fade_db[i] + misc_losses_db[i]
+            c_rx_dbw = tx_power_dbw + tx_gain_dbi + rx_gain_dbi - total_loss_db
+            bw_db = 10.0 * log10(bandwidth_hz[i])
+            noise_floor_dbw = K_THERMAL_DBW + bw_db + noise_figure_db
+            ebn0_db = c_rx_dbw - noise_floor_dbw - 10.0 * log10(spectral_efficiency)
+            out_margin[i] = ebn0_db - required_ebn0
+            out_ebn0[i] = ebn0_db
+            out_fspl[i] = fspl_db
+            out_total_loss[i] = total_loss_db
+            out_noise_floor[i] = noise_floor_dbw
+            out_c_rx[i] = c_rx_dbw
+            out_data_rate[i] = bandwidth_hz[i] * spectral_efficiency
+            out_cn0[i] = c_rx_dbw - noise_floor_dbw + bw_db
+
+
+def calculate_link_metrics_batch(
+    tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz,
+    distance_km, noise_figure_db, bandwidth_hz,
+    spectral_efficiency, required_ebn0,
+    rain_fade_db=0.0, misc_losses_db=0.0
+):
+    """Batch evaluation over 1-D sample arrays (Monte Carlo / sensitivity).
+
+    freq_hz, distance_km, bandwidth_hz, rain_fade_db, and misc_losses_db may
+    be 1-D arrays of equal length (scalars are broadcast); the remaining
+    inputs are scalars. With numba installed the whole batch runs in one
+    compiled parallel loop; otherwise it falls back to the vectorized NumPy
+    sweep. Returns the usual tuple with array entries.
+    """
+    if njit is None:
+        return calculate_link_metrics_sweep(
+            tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz,
+            distance_km, noise_figure_db, bandwidth_hz,
+            spectral_efficiency, required_ebn0,
+            rain_fade_db, misc_losses_db
+        )
+
+    freq_hz, distance_km, bandwidth_hz, rain_fade_db, misc_losses_db = (
+        np.ascontiguousarray(a, dtype=np.float64)
+        for a in np.broadcast_arrays(
+            freq_hz, distance_km, bandwidth_hz, rain_fade_db, misc_losses_db
+        )
+    )
+    outs = tuple(np.empty(freq_hz.size) for _ in range(8))
+    _link_batch_kernel(
+        float(tx_power_dbw), float(tx_gain_dbi), float(rx_gain_dbi), freq_hz.ravel(),
+        distance_km.ravel(), float(noise_figure_db), bandwidth_hz.ravel(),
+        float(spectral_efficiency), float(required_ebn0),
+        rain_fade_db.ravel(), misc_losses_db.ravel(),
+        *outs
+    )
+    return tuple(o.reshape(freq_hz.shape) for o in outs)
+
+
+def make_preset_calculator(tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz):
+    """Partially evaluate calculate_link_metrics for a fixed terminal.
+
+    The combined gains and the frequency term of the FSPL are folded into
+    constants once, so each call does a single log10 on the distance (plus
+    the bandwidth log) instead of re-deriving the fixed terms.
+    """
+    k_fspl_freq = 20.0 * log10(freq_hz) + K_FSPL_DB
+    k_eirp_rx = tx_power_dbw + tx_gain_dbi + rx_gain_dbi
+
+    def calculate_for_preset(
+        distance_km, noise_figure_db, bandwidth_hz,
+        spectral_efficiency, required_ebn0,
+        rain_fade_db=0.0, misc_losses_db=0.0
+    ):
+        fspl_db = 20.0 * log10(distance_km) + k_fspl_freq
+        total_loss_db = fspl_db + rain_fade_db + misc_losses_db
+
+        c_rx_dbw = k_eirp_rx - total_loss_db
+
+        bw_db = 10.0 * log10(bandwidth_hz)
+        noise_floor_dbw = K_THERMAL_DBW + bw_db + noise_figure_db
+        cn0_dbhz = c_rx_dbw - noise_floor_dbw + bw_db
+
+        data_rate_bps = bandwidth_hz * spectral_efficiency
+        ebn0_db = c_rx_dbw - noise_floor_dbw - 10.0 * log10(spectral_efficiency)
+        link_margin_db = ebn0_db - required_ebn0
+
+        return (
+            link_margin_db,
+            ebn0_db,
+            fspl_db,
+            total_loss_db,
+            noise_floor_dbw,
+            c_rx_dbw,
+            data_rate_bps,
+            cn0_dbhz
+        )
+
+    return calculate_for_preset
+
+
+def calculate_link_metrics_sweep(
+    tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz,
+    distance_km, noise_figure_db, bandwidth_hz,
+    spectral_efficiency, required_ebn0,
+    rain_fade_db=0.0, misc_losses_db=0.0
+):
+    """Array-capable sibling of calculate_link_metrics for sensitivity sweeps.
+
+    Any argument may be a NumPy array (e.g. a distance or frequency axis);
+    the whole sweep is computed in a handful of vectorized passes instead of
+    one Python call per point. Inputs follow normal broadcasting rules, so a
+    2-D margin grid is one call:
+
+        calculate_link_metrics_sweep(..., freq_hz=f[None, :],
+                                     distance_km=d[:, None], ...)
+
+    Returns the same tuple with array entries.
+    """
+    freq_hz = np.asarray(freq_hz, dtype=np.float64)
+    distance_km = np.asarray(distance_km, dtype=np.float64)
+    bandwidth_hz = np.asarray(bandwidth_hz, dtype=np.float64)
+    spectral_efficiency = np.asarray(spectral_efficiency, dtype=np.float64)
+
+    # log10(d) + log10(f) fused into one log10(d*f) pass: half the
+    # transcendental work and one fewer temporary array per sweep.
+    fspl_db = 20.0 * np.log10(distance_km * freq_hz) + K_FSPL_DB
+    total_loss_db = fspl_db + rain_fade_db + misc_losses_db
+
+    c_rx_dbw = tx_power_dbw + tx_gain_dbi + rx_gain_dbi - total_loss_db
+
+    bw_db = 10.0 * np.log10(bandwidth_hz)
+    noise_floor_dbw = K_THERMAL_DBW + bw_db + noise_figure_db
+    cn0_dbhz = c_rx_dbw - noise_floor_dbw + bw_db
+
+    data_rate_bps = bandwidth_hz * spectral_efficiency
+    # Same cancellation as the scalar version: the bandwidth logs drop out.
+    ebn0_db = c_rx_dbw - noise_floor_dbw - 10.0 * np.log10(spectral_efficiency)
+    link_margin_db = ebn0_db - required_ebn0
+
+    return (
+        link_margin_db,
+        ebn0_db,
+        fspl_db,
+        total_loss_db,
+        noise_floor_dbw,
+        c_rx_dbw,
+        data_rate_bps,
+        cn0_dbhz
+    )
+
+
+# ----------------------------------------
+# Export HTML
+# ----------------------------------------
+_TPL_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+def render_html_report(template, context):
+    # Takes the template text (cached by the caller), not a path, so the
+    # file is not re-read on every render. A single regex pass substitutes
+    # every placeholder; unknown keys are left verbatim.
+    return _TPL_RE.sub(lambda m: str(context.get(m.group(1), m.group(0))), template)
@@ -1,90 +1,168 @@
 import streamlit as st
 import numpy as np
+import functools
 import json
 from pathlib import Path
 import io
 
+import satcom_core
+from satcom_core import (
+    ENV_LOSSES as _ENV_LOSSES,
+    MODCOD_IDX as _MODCOD_IDX,
+    MODCOD_NAMES as _MODCOD_NAMES,
+    render_html_report,
+)
 
-
+# Streamlit-memoized wrapper around the pure core calculator: the math
+# lives in satcom_core, the caching policy lives with the UI.
+# classify_band carries its own lru_cache in the core, which is cheaper
+# than an st.cache_data layer for a single-string result.
+classify_band = satcom_core.classify_band
+calculate_link_metrics = st.cache_data(max_entries=1024)(satcom_core.calculate_link_metrics)
 
 # ----------------------------------------
-# MODCOD Table
+# UI Constants
 # ----------------------------------------
-modcod_table = {
-    "BPSK 1/2": {"required_ebn0": 1.5, "spectral_efficiency": 0.5},
-    "QPSK 1/2": {"required_ebn0": 2.0, "spectral_efficiency": 1.0},
-    "QPSK 3/4": {"required_ebn0": 4.5, "spectral_efficiency": 1.5},
-    "8PSK 2/3": {"required_ebn0": 6.5, "spectral_efficiency": 2.0},
-    "16QAM 3/4": {"required_ebn0": 9.0, "spectral_efficiency": 3.0}
-}
+_VALID_BANDS = frozenset(["UHF", "L-band", "S-band", "X-band", "Ku-band", "Ka-band"])
 
-# ----------------------------------------
-# Frequency Band Classifier
-# ----------------------------------------
-def classify_band(freq_hz):
-    if freq_hz < 3e8:
-        return "HF/VHF"
-    elif freq_hz < 1e9:
-        return "UHF"
-    elif freq_hz < 2e9:
-        return "L-band"
-    elif freq_hz < 4e9:
-        return "S-band"
-    elif freq_hz < 8e9:
-        return "C-band"
-    elif freq_hz < 12e9:
-        return "X-band"
-    elif freq_hz < 18e9:
-        return "Ku-band"
-    elif freq_hz < 26e9:
-        return "K-band"
-    else:
-        return "Ka-band"
+_LOSS_CHART_LABELS = ("Free-Space Loss", "Rain Fade", "Misc Loss")
+_LOSS_CHART_COLORS = ("#5DADE2", "#58D68D", "#F4D03F")
 
 # ----------------------------------------
-# Link Margin and Eb/N0 Calculator
+# Terminal Presets
 # ----------------------------------------
-def calculate_link_metrics(
-    tx_power_dbw, tx_gain_dbi, rx_gain_dbi, freq_hz,
-    distance_km, noise_figure_db, bandwidth_hz,
-    spectral_efficiency, required_ebn0,
-    rain_fade_db=0.0, misc_losses_db=0.0
-):
-    c = 3e8
-    wavelength_m = c / freq_hz
-    fspl_db = 20 * np.log10((4 * np.pi * distance_km * 1000) / wavelength_m)
-    total_loss_db = fspl_db + rain_fade_db + misc_losses_db
-
-    eirp_dbw = tx_power_dbw + tx_gain_dbi
-    c_rx_dbw = eirp_dbw + rx_gain_dbi - total_loss_db
-
-    noise_floor_dbw = -228.6 + 10 * np.log10(bandwidth_hz) + noise_figure_db
-    cn0_dbhz = c_rx_dbw - noise_floor_dbw + 10 * np.log10(bandwidth_hz)
-
-    data_rate_bps = bandwidth_hz * spectral_efficiency
-    ebn0_db = cn0_dbhz - 10 * np.log10(data_rate_bps)
-    link_margin_db = ebn0_db - required_ebn0
-
-    return (
-        link_margin_db,
-        ebn0_db,
-        fspl_db,
-        total_loss_db,
-        noise_floor_dbw,
-        c_rx_dbw,
-        data_rate_bps,
-        cn0_dbhz
-    )
+_PRESET_PATH = Path(__file__).parent / "terminal_presets.json"
+_TEMPLATE_PATH = Path(__file__).parent / "report_template.html"
+
+@st.cache_resource
+def load_template():
+    # Read once per process; render_html_report works on the cached text.
+    return _TEMPLATE_PATH.read_text()
+
+@st.cache_resource
+def load_terminal_presets():
+    # Parsed exactly once per process; reruns get the cached dict.
+    return json.loads(_PRESET_PATH.read_text())
+
+@st.cache_resource
+def _preset_options():
+    # Selectbox options never change after load; build the tuple once
+    # instead of concatenating a fresh list every rerun.
+    return ("Custom", *load_terminal_presets())
+
+@st.cache_resource
+def _preset_calculators():
+    # One partially-evaluated calculator per preset, built once per process:
+    # gains and the frequency FSPL term are folded into closure constants.
+    return {
+        name: satcom_core.make_preset_calculator(
+            p["tx_power_dbw"], p["tx_gain_dbi"], p["rx_gain_dbi"], p["freq_ghz"] * 1e9
+        )
+        for name, p in load_terminal_presets().items()
+    }
 
 #-----------------------------------------
-# Export HTML
+# Loss Breakdown Chart
+#-----------------------------------------
+@functools.lru_cache(maxsize=1)
+def _plt():
+    # The first chart render pays the matplotlib import and pins the Agg
+    # backend (we only ever rasterize to PNG); every later call is a cache hit.
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+@st.cache_data(max_entries=64)
+def _render_loss_chart_png(fspl_db, rain_fade_db, misc_losses_db):
+    # Memoized on the three loss values: figure construction and rendering
+    # only happen when a loss actually changes, not on every rerun.
+    plt = _plt()
+
+    # Floor at 0.01 so the log-scale axis never sees a zero bar.
+    loss_values = np.maximum(np.abs(np.array([fspl_db, rain_fade_db, misc_losses_db])), 0.01)
+
+    fig, ax = plt.subplots()
+    bars = ax.bar(_LOSS_CHART_LABELS, loss_values, color=_LOSS_CHART_COLORS)
+    ax.set_ylabel("Loss (dB)")
+    ax.set_title("Environmental and Path Loss Components")
+    ax.set_yscale("log")
+    ax.bar_label(bars, fmt="%.1f", padding=3)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return buf.getvalue()
+
 #-----------------------------------------
-def render_html_report(template_path, context):
-    with open(template_path, 'r') as f:
-        template = f.read()
-    for key, value in context.items():
-        template = template.replace(f"{{{{ {key} }}}}", str(value))
-    return template
+# Variable Reference Guide
+#-----------------------------------------
+@st.cache_data(max_entries=64)
+def _var_reference_md(
+    tx_power, tx_gain, rx_gain, freq_ghz, distance_km, bandwidth_mhz,
+    noise_figure_db, spectral_efficiency, required_ebn0,
+    rain_fade_db, misc_losses_db
+):
+    # The guide is a ~40-line interpolated string; memoizing on the displayed
+    # scalars means reruns reuse the formatted text instead of rebuilding it.
+    return f"""
+**Tx Power (dBW):** `{tx_power}`  
+Transmitter output power expressed in decibel-watts. Typically constrained by terminal size, power budget, and regulatory limits.
+
+**Tx Antenna Gain (dBi):** `{tx_gain}`  
+Directional gain of the transmitting antenna located on the ground terminal. Higher values focus energy into a narrower beam, increasing effective radiated power (EIRP).
+
+**Rx Antenna Gain (dBi):** `{rx_gain}`  
+Gain of the receiving antenna located on the satellite. Generally high due to the use of parabolic or phased array antennas.
+
+**Operating Frequency:** `{freq_ghz:.3f}` GHz  
+Center frequency of the RF carrier. Determines free-space path loss, antenna design, and susceptibility to environmental effects like rain fade.  
+Tactical SATCOM commonly operates in the following bands:  
+- **UHF** (~0.3 GHz)  
+- **L-band** (~1.5 GHz)  
+- **S-band** (~2.2 GHz)  
+- **X-band** (~8.4 GHz)  
+- **Ku-band** (~14 GHz)  
+- **Ka-band** (~30 GHz)
+
+**Distance to Target:** `{distance_km}` km  
+Slant range between the terminal and satellite.  
+Typical values:  
+- GEO SATCOM: ~35,786 km  
+- MEO: ~8,000–12,000 km  
+- LEO: ~500–2,000 km  
+Values below ~1,000 km are only applicable for LEO-based systems.
+
+**Bandwidth:** `{bandwidth_mhz}` MHz  
+Allocated RF channel width. Determines maximum throughput and noise power. Not directly selected by users in most systems; defined by waveform or service plan.  
+Typical ranges:  
+- Voice / messaging: 25–100 kHz  
+- Tactical data / C2: 0.1–2 MHz  
+- Video or high-rate ISR: 2–5 MHz+
+
+**Noise Figure:** `{noise_figure_db}` dB  
+Represents degradation of signal-to-noise ratio introduced by the receiver’s RF front end. Primarily driven by the low-noise amplifier (LNA) and frequency conversion stages.  
+Typical tactical values: 2–6 dB.
+
+**Spectral Efficiency:** `{spectral_efficiency} bps/Hz`  
+The ratio of data rate to bandwidth. Reflects how efficiently information is packed into the RF signal.  
+- Higher values indicate more bits per second per Hz of bandwidth, but typically require better signal conditions (higher Eb/N₀).  
+- For example, QPSK with 1/2 coding ≈ 1.0 bps/Hz, 8PSK 2/3 ≈ 2.0 bps/Hz.  
+- Spread-spectrum systems like MUOS may operate at low spectral efficiency by design, prioritizing resilience over speed.
+
+**Required Eb/N₀:** `{required_ebn0} dB`  
+The minimum energy per bit to noise density ratio required for reliable demodulation or decoding, based on the waveform, coding, and system margin.  
+- Lower values indicate more robust (but lower throughput) modulation/coding.  
+- For example, robust coding might require as low as 1–2 dB, while high-speed links (e.g., 64QAM) might need 10+ dB.  
+- In spread-spectrum systems, required Eb/N₀ is often much lower due to processing gain.
+
+
+**Rain Fade Loss:** `{rain_fade_db}` dB  
+Estimated link attenuation due to precipitation and atmospheric moisture. Increases with frequency and rainfall rate. Most significant above ~6 GHz.
+
+**Miscellaneous Loss:** `{misc_losses_db}` dB  
+Aggregate margin for non-modeled losses including polarization mismatch, antenna mispointing, RF cable loss, filter insertion loss, and implementation inefficiencies.
+"""
 
 # ----------------------------------------
 # Streamlit App UI
@@ -101,88 +179,138 @@ with input_col:
 
 
 
-    # Sliders with preset defaults
-    tx_power = st.slider("Transmitter Power (dBW)", 0, 30, 10)
-    tx_gain = st.slider("Tx Antenna Gain (dBi)", 0, 30, 10)
-    rx_gain = st.slider("Rx Antenna Gain (dBi)", 0, 30, 10)
-    # Determine defaults if waveform selected
-    default_modcod = "QPSK 1/2"
-    default_bandwidth = 1.0
-
-
+    # Batch widget changes: the script reruns once per Recalculate click
+    # instead of once per slider drag tick.
+    with st.form("satcom_cfg", clear_on_submit=False):
+        terminal_presets = load_terminal_presets()
+        preset_name = st.selectbox(
+            "Terminal Preset",
+            _preset_options(),
+            help="Choose a representative terminal to pre-fill the sliders, or Custom for manual entry."
+        )
+        preset = terminal_presets.get(preset_name, {})
+
+        # Sliders with preset defaults
+        tx_power = st.slider("Transmitter Power (dBW)", 0, 30, preset.get("tx_power_dbw", 10))
+        tx_gain = st.slider("Tx Antenna Gain (dBi)", 0, 30, preset.get("tx_gain_dbi", 10))
+        rx_gain = st.slider("Rx Antenna Gain (dBi)", 0, 30, preset.get("rx_gain_dbi", 10))
+        # Determine defaults if waveform selected
+        default_modcod = preset.get("modcod", "QPSK 1/2")
+        default_bandwidth = preset.get("bandwidth_mhz", 1.0)
+
+
+
+
+        freq_ghz = st.number_input(
+               "Operating Frequency (GHz)",
+                min_value=0.1,
+                max_value=50.0,
+                value=preset.get("freq_ghz", 8.4),
+                step=0.1,
+                help="Center frequency of the link. Tactical SATCOM typically uses UHF (~0.3), L (~1.5), S (~2.2), X (~8.4), Ku (~14), or Ka (~30) GHz."
+            )
+        freq_hz = freq_ghz * 1e9
+
+        environment = st.selectbox(
+            "Operating Environment",
+            list(_ENV_LOSSES),
+            index=2,
+            help="Seeds typical rain fade and miscellaneous loss values; both can be overridden below."
+        )
+        default_rain_fade, default_misc_losses = _ENV_LOSSES[environment]
+
+        rain_fade_db = st.number_input(
+            "Rain Fade Loss (dB)",
+            min_value=0.0,
+            max_value=20.0,
+            value=default_rain_fade,
+            help="Estimate of link attenuation due to precipitation. Most significant above ~6 GHz."
+        )
 
+        misc_losses_db = st.number_input(
+            "Miscellaneous Losses (dB)",
+            min_value=0.0,
+            max_value=20.0,
+            value=default_misc_losses,
+            help="Includes pointing error, polarization mismatch, cable losses, etc."
+        )
 
-    freq_ghz = st.number_input(
-           "Operating Frequency (GHz)",
-            min_value=0.1,
-            max_value=50.0,
-            value=8.4,
-            step=0.1,
-            help="Center frequency of the link. Tactical SATCOM typically uses UHF (~0.3), L (~1.5), S (~2.2), X (~8.4), Ku (~14), or Ka (~30) GHz."
+        distance_km = st.slider("Distance to Target (km)", 100, 100000, 35786)
+        noise_figure_db = st.slider(
+            "System Noise Figure (dB)",
+            min_value=1.0,
+            max_value=10.0,
+            value=3.0,
+            help="System Noise Figure represents the added internal receiver noise. Lower = better. Tactical SATCOM systems typically range from 2–6 dB."
         )
-    freq_hz = freq_ghz * 1e9
-
-    rain_fade_db = st.number_input(
-        "Rain Fade Loss (dB)",
-        min_value=0.0,
-        max_value=20.0,
-        value=3.0,
-        help="Estimate of link attenuation due to precipitation. Most significant above ~6 GHz."
-    )
+        bandwidth_mhz = st.slider(
+            "Bandwidth (MHz)",
+            min_value=0.01,
+            max_value=20.0,
+            value=default_bandwidth,
+            step=0.01,
+            help="Signal bandwidth used for the transmission, affects both data rate and noise floor."
+        )
+        bandwidth_hz = bandwidth_mhz * 1e6
 
-    misc_losses_db = st.number_input(
-        "Miscellaneous Losses (dB)",
-        min_value=0.0,
-        max_value=20.0,
-        value=2.0,
-        help="Includes pointing error, polarization mismatch, cable losses, etc."
-    )
+        modcod = st.selectbox(
+            "MODCOD",
+            _MODCOD_NAMES,
+            index=_MODCOD_IDX[default_modcod],
+            help="Modulation and coding scheme. Sets the default spectral efficiency and required Eb/N0 below."
+        )
+        modcod_req_ebn0, modcod_se = satcom_core.modcod_params(modcod)
 
-    distance_km = st.slider("Distance to Target (km)", 100, 100000, 35786)
-    noise_figure_db = st.slider(
-        "System Noise Figure (dB)",
-        min_value=1.0,
-        max_value=10.0,
-        value=3.0,
-        help="System Noise Figure represents the added internal receiver noise. Lower = better. Tactical SATCOM systems typically range from 2–6 dB."
-    )
-    bandwidth_mhz = st.slider(
-        "Bandwidth (MHz)",
-        min_value=0.01,
-        max_value=20.0,
-        value=default_bandwidth,
-        step=0.01,
-        help="Signal bandwidth used for the transmission, affects both data rate and noise floor."
-    )
-    bandwidth_hz = bandwidth_mhz * 1e6
+        spectral_efficiency = st.number_input(
+            "Spectral Efficiency (bps/Hz)", min_value=0.1, max_value=10.0,
+            value=modcod_se,
+            help="Ratio of data rate to bandwidth. For example, QPSK 1/2 = 1.0, 8PSK 2/3 = 2.0"
+        )
 
-    spectral_efficiency = st.number_input(
-        "Spectral Efficiency (bps/Hz)", min_value=0.1, max_value=10.0, value=1.0,
-        help="Ratio of data rate to bandwidth. For example, QPSK 1/2 = 1.0, 8PSK 2/3 = 2.0"
-    )
+        required_ebn0 = st.number_input(
+            "Required Eb/N0 (dB)", min_value=-10.0, max_value=20.0,
+            value=modcod_req_ebn0,
+            help="Threshold for reliable demodulation/decoding. Depends on modulation and coding."
+        )
 
-    required_ebn0 = st.number_input(
-        "Required Eb/N0 (dB)", min_value=-10.0, max_value=20.0, value=2.0,
-        help="Threshold for reliable demodulation/decoding. Depends on modulation and coding."
-    )
+        submitted = st.form_submit_button("Recalculate")
 
     band = classify_band(freq_hz)
 
     st.markdown(f"**Estimated Band:** {band}")
 
-    valid_bands = ["UHF", "L-band", "S-band", "X-band", "Ku-band", "Ka-band"]
-    if band not in valid_bands:
+    if band not in _VALID_BANDS:
         st.error("⚠️ Frequency entered is outside typical SATCOM bands.")
 
 
 
 # --- Calculate ---
-margin, ebn0, fspl, total_loss, noise_floor, c_rx, data_rate, cn0_dbhz = calculate_link_metrics(
+# Short-circuit when no numeric input changed (e.g. the user only toggled
+# the loss chart): reuse the results held in session state without even a
+# cache lookup.
+_inputs_key = (
     tx_power, tx_gain, rx_gain, freq_hz,
     distance_km, noise_figure_db, bandwidth_hz,
     spectral_efficiency, required_ebn0,
     rain_fade_db, misc_losses_db
 )
+if st.session_state.get("_last_inputs") != _inputs_key:
+    # Use the preset's partially-evaluated calculator while the terminal
+    # parameters still match the preset; fall back to the general path as
+    # soon as the user overrides any of them.
+    if preset and (tx_power, tx_gain, rx_gain, freq_hz) == (
+        preset["tx_power_dbw"], preset["tx_gain_dbi"], preset["rx_gain_dbi"], preset["freq_ghz"] * 1e9
+    ):
+        st.session_state["_last_results"] = _preset_calculators()[preset_name](
+            distance_km, noise_figure_db, bandwidth_hz,
+            spectral_efficiency, required_ebn0,
+            rain_fade_db, misc_losses_db
+        )
+    else:
+        st.session_state["_last_results"] = calculate_link_metrics(*_inputs_key)
+    st.session_state["_last_inputs"] = _inputs_key
+
+margin, ebn0, fspl, total_loss, noise_floor, c_rx, data_rate, cn0_dbhz = st.session_state["_last_results"]
 context = {
     "tx_power": tx_power,
     "tx_gain": tx_gain,
@@ -203,12 +331,11 @@ context = {
     "link_margin": round(margin, 2)
 }
 
-html_report = render_html_report("report_template.html", context)
-html_bytes = io.BytesIO(html_report.encode("utf-8"))
+html_report = render_html_report(load_template(), context)
 
 st.download_button(
     label="Download Link Budget Report (.html)",
-    data=html_bytes,
+    data=html_report,
     file_name="link_budget_report.html",
     mime="text/html"
 )
@@ -216,68 +343,22 @@ st.download_button(
 
 # reference guide
 with st.expander("Variable Reference Guide"):
-    st.markdown(f"""
-**Tx Power (dBW):** `{tx_power}`  
-Transmitter output power expressed in decibel-watts. Typically constrained by terminal size, power budget, and regulatory limits.
-
-**Tx Antenna Gain (dBi):** `{tx_gain}`  
-Directional gain of the transmitting antenna located on the ground terminal. Higher values focus energy into a narrower beam, increasing effective radiated power (EIRP).
-
-**Rx Antenna Gain (dBi):** `{rx_gain}`  
-Gain of the receiving antenna located on the satellite. Generally high due to the use of parabolic or phased array antennas.
-
-**Operating Frequency:** `{freq_ghz:.3f}` GHz  
-Center frequency of the RF carrier. Determines free-space path loss, antenna design, and susceptibility to environmental effects like rain fade.  
-Tactical SATCOM commonly operates in the following bands:  
-- **UHF** (~0.3 GHz)  
-- **L-band** (~1.5 GHz)  
-- **S-band** (~2.2 GHz)  
-- **X-band** (~8.4 GHz)  
-- **Ku-band** (~14 GHz)  
-- **Ka-band** (~30 GHz)
-
-**Distance to Target:** `{distance_km}` km  
-Slant range between the terminal and satellite.  
-Typical values:  
-- GEO SATCOM: ~35,786 km  
-- MEO: ~8,000–12,000 km  
-- LEO: ~500–2,000 km  
-Values below ~1,000 km are only applicable for LEO-based systems.
-
-**Bandwidth:** `{bandwidth_mhz}` MHz  
-Allocated RF channel width. Determines maximum throughput and noise power. Not directly selected by users in most systems; defined by waveform or service plan.  
-Typical ranges:  
-- Voice / messaging: 25–100 kHz  
-- Tactical data / C2: 0.1–2 MHz  
-- Video or high-rate ISR: 2–5 MHz+
-
-**Noise Figure:** `{noise_figure_db}` dB  
-Represents degradation of signal-to-noise ratio introduced by the receiver’s RF front end. Primarily driven by the low-noise amplifier (LNA) and frequency conversion stages.  
-Typical tactical values: 2–6 dB.
-
-**Spectral Efficiency:** `{spectral_efficiency} bps/Hz`  
-The ratio of data rate to bandwidth. Reflects how efficiently information is packed into the RF signal.  
-- Higher values indicate more bits per second per Hz of bandwidth, but typically require better signal conditions (higher Eb/N₀).  
-- For example, QPSK with 1/2 coding ≈ 1.0 bps/Hz, 8PSK 2/3 ≈ 2.0 bps/Hz.  
-- Spread-spectrum systems like MUOS may operate at low spectral efficiency by design, prioritizing resilience over speed.
-
-**Required Eb/N₀:** `{required_ebn0} dB`  
-The minimum energy per bit to noise density ratio required for reliable demodulation or decoding, based on the waveform, coding, and system margin.  
-- Lower values indicate more robust (but lower throughput) modulation/coding.  
-- For example, robust coding might require as low as 1–2 dB, while high-speed links (e.g., 64QAM) might need 10+ dB.  
-- In spread-spectrum systems, required Eb/N₀ is often much lower due to processing gain.
-
-
-**Rain Fade Loss:** `{rain_fade_db}` dB  
-Estimated link attenuation due to precipitation and atmospheric moisture. Increases with frequency and rainfall rate. Most significant above ~6 GHz.
-
-**Miscellaneous Loss:** `{misc_losses_db}` dB  
-Aggregate margin for non-modeled losses including polarization mismatch, antenna mispointing, RF cable loss, filter insertion loss, and implementation inefficiencies.
-    """)
+    st.markdown(_var_reference_md(
+        tx_power, tx_gain, rx_gain, freq_ghz, distance_km, bandwidth_mhz,
+        noise_figure_db, spectral_efficiency, required_ebn0,
+        rain_fade_db, misc_losses_db
+    ))
 
 
     
-with output_col:
+@st.fragment
+def _render_outputs(
+    margin, ebn0, fspl, total_loss, noise_floor, c_rx, data_rate, cn0_dbhz,
+    required_ebn0, rain_fade_db, misc_losses_db
+):
+    # Runs as a fragment: interactions inside the column (the chart
+    # toggle, the definitions expander) rerun only this function, not
+    # the whole script with its widget tree and report rendering.
     st.header("📈 Link Budget Results")
     st.metric("Link Margin", f"{margin:.2f} dB")
     st.metric(
@@ -307,25 +388,10 @@ with output_col:
     show_loss_chart = st.checkbox("📊 Show Loss Breakdown Chart")
 
     if show_loss_chart:
-        import matplotlib.pyplot as plt
-
-        labels = ['Free-Space Loss', 'Rain Fade', 'Misc Loss']
-        loss_values = [
-            max(abs(fspl), 0.01),
-            max(rain_fade_db, 0.01),
-            max(misc_losses_db, 0.01)
-        ]
-
-        fig, ax = plt.subplots()
-        bars = ax.bar(labels, loss_values, color=["#5DADE2", "#58D68D", "#F4D03F"])
-        ax.set_ylabel("Loss (dB)")
-        ax.set_title("Environmental and Path Loss Components")
-        ax.set_yscale("log")
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2., height + 0.5, f'{height:.1f}', ha='center')
         st.caption("This chart visualizes how different loss components reduce the received signal power.")
-        st.pyplot(fig)
+        # Key the cache on display precision: losses differing past two
+        # decimals render the same chart, so don't redraw for them.
+        st.image(_render_loss_chart_png(round(fspl, 2), round(rain_fade_db, 2), round(misc_losses_db, 2)))
     if margin > 10:
         st.success("✅ Strong link — highly reliable.")
     elif margin > 3:
@@ -336,4 +402,8 @@ with output_col:
         st.error("❌ Link not viable — adjust system parameters.")
 
 
-
+with output_col:
+    _render_outputs(
+        margin, ebn0, fspl, total_loss, noise_floor, c_rx, data_rate, cn0_dbhz,
+        required_ebn0, rain_fade_db, misc_losses_db
+    )